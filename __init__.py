@@ -5,7 +5,7 @@ This package provides a unified interface to search for jobs across
 multiple sources using a simple function call.
 """
 
-from scraper import scrape_jobs
+from scraper import scrape_jobs, scrape_jobs_multi
 
 __version__ = "1.0.0"
-__all__ = ['scrape_jobs']
+__all__ = ['scrape_jobs', 'scrape_jobs_multi']
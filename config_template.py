@@ -10,4 +10,5 @@ HEADLESS_BROWSER = True  # Run browser in headless mode
 USNLX_BASE_URL = "https://usnlx.com/jobs/"
 USNLX_TIMEOUT = 10  # Timeout in seconds for page elements
 USNLX_MAX_MORE_CLICKS = 50  # Maximum number of times to click "More" button
-IMPLICIT_WAIT = 5  # Implicit wait time in seconds
+USNLX_DETAIL_CONCURRENCY = 20  # Maximum concurrent job detail page requests
+USNLX_SEARCH_TIMEOUT = 1800  # Seconds before a parallel search's worker (and its browser) is killed
@@ -1,8 +1,10 @@
 """
 Job scraper for USNLX.
 """
+from itertools import product
 from typing import List, Dict
-from usnlx_scraper import USNLXScraper
+from usnlx_scraper import USNLXScraper, search_jobs_parallel
+from utils import deduplicate_jobs
 
 
 def scrape_jobs(role: str, city: str) -> List[Dict]:
@@ -36,3 +38,31 @@ def scrape_jobs(role: str, city: str) -> List[Dict]:
     except Exception as e:
         print(f"Error scraping USNLX: {e}")
         return []
+
+
+def scrape_jobs_multi(roles: List[str], cities: List[str], processes: int = None) -> List[Dict]:
+    """
+    Search USNLX for every combination of roles and cities in parallel.
+    
+    Each search runs in its own process with its own browser. Call this
+    from under an ``if __name__ == "__main__":`` guard.
+    
+    Args:
+        roles: Job roles/titles to search for
+        cities: City names or "City, State" formats
+        processes: Number of worker processes (default: one per search, capped at CPU count)
+    
+    Returns:
+        Deduplicated list of job dictionaries (same fields as scrape_jobs)
+    
+    Example:
+        >>> jobs = scrape_jobs_multi(["Nurse", "Pharmacist"], ["Chicago", "Denver"])
+    """
+    searches = [{'role': role, 'city': city} for role, city in product(roles, cities)]
+    try:
+        jobs = deduplicate_jobs(search_jobs_parallel(searches, processes))
+        print(f"Retrieved {len(jobs)} unique jobs from USNLX across {len(searches)} searches")
+        return jobs
+    except Exception as e:
+        print(f"Error scraping USNLX: {e}")
+        return []
@@ -13,7 +13,8 @@ def scrape_jobs_detailed(
     city: str = None,
     radius_miles: int = None,
     include_keywords: List[str] = None,
-    exclude_keywords: List[str] = None
+    exclude_keywords: List[str] = None,
+    max_results: int = None
 ) -> List[Dict]:
     """
     Search for jobs with detailed information extraction.
@@ -29,6 +30,7 @@ def scrape_jobs_detailed(
         radius_miles: Search radius in miles (e.g., 25, 50, 100)
         include_keywords: Keywords to filter for (if not using search_name)
         exclude_keywords: Keywords to filter out (if not using search_name)
+        max_results: Stop once this many matching jobs are found (default: all)
     
     Returns:
         List of detailed job dictionaries
@@ -57,6 +59,7 @@ def scrape_jobs_detailed(
         radius_miles = config.get('radius_miles', radius_miles)
         include_keywords = config.get('include_keywords')
         exclude_keywords = config.get('exclude_keywords')
+        max_results = config.get('max_results', max_results)
     elif not role or not city:
         raise ValueError("Must provide either search_name or both role and city")
     
@@ -77,7 +80,8 @@ def scrape_jobs_detailed(
         radius_miles=radius_miles,
         extract_details=True,
         include_keywords=include_keywords,
-        exclude_keywords=exclude_keywords
+        exclude_keywords=exclude_keywords,
+        max_results=max_results
     )
     
     # Add timestamp to each job
@@ -12,11 +12,249 @@ from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
-from bs4 import BeautifulSoup
-from typing import List, Dict
+from selectolax.lexbor import LexborHTMLParser
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
+import ahocorasick
+import asyncio
+import functools
+import httpx
+import json
+import multiprocessing
+import multiprocessing.util
+import os
+import re
+import signal
 import time
 import config
-from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+# Each job in the search results is rendered as one of these links
+_JOB_LINK_SELECTOR = 'a.flex.px-2.py-4'
+
+# Patterns used to pull structured fields out of job descriptions
+# Pay ranges, most specific first: a range with a period anywhere in the
+# description wins over a bare range
+_PAY_PATTERNS = (
+    re.compile(r'\$[\d,]+\s*-\s*\$[\d,]+\s*(?:per|/)\s*(?:year|hour|yr|hr)', re.IGNORECASE),
+    re.compile(r'\$[\d,]+k?\s*-\s*\$[\d,]+k?', re.IGNORECASE),
+)
+_BENEFITS_RE = re.compile(
+    r'\b(health insurance|401k|pto|paid time off|dental|vision|retirement|bonus)\b',
+    re.IGNORECASE
+)
+# Employment type and remote status keywords, classified in one sweep by
+# the name of the group that matched. Matched as plain substrings so that
+# e.g. "remotely" and "contractor" still count.
+_CLASSIFY_RE = re.compile(
+    r'(?P<ft>full[- ]time)|(?P<pt>part[- ]time)|(?P<ct>contract)'
+    r'|(?P<hy>hybrid)|(?P<nr>not remote)|(?P<rm>remote)|(?P<os>on[- ]site|onsite|in-office)',
+    re.IGNORECASE
+)
+_DATE_POSTED_RE = re.compile(r'"datePosted"\s*:\s*"([^"]+)"')
+_DETAIL_FIELDS = (
+    'summary', 'pay_range', 'employment_type', 'remote_status',
+    'benefits', 'description', 'posted_date'
+)
+_EMPLOYMENT_TYPES = (('ft', 'Full-time'), ('pt', 'Part-time'), ('ct', 'Contract'))
+
+# Older config.py files predate this setting
+_DETAIL_CONCURRENCY = getattr(config, 'USNLX_DETAIL_CONCURRENCY', 20)
+
+# Upper bound on one search in search_jobs_parallel before its worker is abandoned
+_SEARCH_TIMEOUT = getattr(config, 'USNLX_SEARCH_TIMEOUT', 1800)
+
+# Web fonts the browser doesn't need to fetch (with and without a query
+# string). Stylesheets are left alone: the site uses Tailwind's `hidden`
+# class, and without CSS hidden elements such as a spent "More" button
+# would count as visible/clickable.
+_BLOCKED_URL_PATTERNS = [
+    pattern
+    for ext in ('woff', 'woff2', 'ttf', 'otf')
+    for pattern in (f'*.{ext}', f'*.{ext}?*')
+]
+
+# Start each driver in its own session so the driver and the browser it
+# launches can be killed together as one process group
+_DRIVER_POPEN_KW = {'start_new_session': True} if os.name == 'posix' else {}
+
+# Job detail pages are fetched over plain HTTP; present as a regular browser
+_HTTP_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+    )
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _chrome_driver_path() -> str:
+    """Resolve (and download if needed) the ChromeDriver binary once per process."""
+    return ChromeDriverManager().install()
+
+
+@functools.lru_cache(maxsize=1)
+def _gecko_driver_path() -> str:
+    """Resolve (and download if needed) the GeckoDriver binary once per process."""
+    return GeckoDriverManager().install()
+
+
+def _build_keyword_automaton(keywords: List[str]) -> Optional[ahocorasick.Automaton]:
+    """
+    Build an Aho-Corasick automaton matching any of the given keywords.
+    
+    Args:
+        keywords: Keywords to match (case-insensitive)
+    
+    Returns:
+        Automaton yielding the lowercased keyword for each hit, or None if
+        there are no keywords
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords or []:
+        if keyword:
+            automaton.add_word(keyword.lower(), keyword.lower())
+    if not len(automaton):
+        return None
+    automaton.make_automaton()
+    return automaton
+
+
+def _parse_detail_html(html: str, job_url: str) -> Dict:
+    """
+    Extract detailed information from a job detail page.
+    
+    Module-level so it can be run in a worker process.
+    
+    Args:
+        html: Raw HTML of the job detail page
+        job_url: URL of the job detail page (used for error reporting)
+    
+    Returns:
+        Dictionary with detailed job information
+    """
+    details = dict.fromkeys(_DETAIL_FIELDS)
+    
+    try:
+        tree = LexborHTMLParser(html)
+        
+        # Extract job description (usually in a div with class 'job-description' or similar)
+        desc_elem = tree.css_first('div.job-description, div#job-description')
+        if not desc_elem:
+            # Try to find a div containing substantial text, looking inside
+            # the main content area first rather than every div in the page
+            # (separate queries: a combined selector yields divs twice when
+            # an <article> sits inside <main>)
+            for selector in ('main div', 'article div', 'div'):
+                desc_elem = next(
+                    (div for div in tree.css(selector)
+                     if len(div.text(deep=True, strip=True)) > 200),  # Likely the description
+                    None
+                )
+                if desc_elem:
+                    break
+        
+        if desc_elem:
+            lines = desc_elem.text(separator='\n', strip=True).split('\n')
+            details['description'] = '\n'.join(line for line in lines if line)
+            
+            # Try to extract specific fields from description
+            desc_text = details['description']
+            
+            # Find employment type and remote status keywords in one pass
+            found = {match.lastgroup for match in _CLASSIFY_RE.finditer(desc_text)}
+            
+            # Extract employment type
+            for group, employment_type in _EMPLOYMENT_TYPES:
+                if group in found:
+                    details['employment_type'] = employment_type
+                    break
+            
+            # Extract remote status
+            if 'rm' in found and 'nr' not in found:
+                if 'hy' in found:
+                    details['remote_status'] = 'Hybrid'
+                else:
+                    details['remote_status'] = 'Remote'
+            elif 'os' in found:
+                details['remote_status'] = 'On-site'
+            
+            # Try to extract pay range (common patterns)
+            for pattern in _PAY_PATTERNS:
+                pay_match = pattern.search(desc_text)
+                if pay_match:
+                    details['pay_range'] = pay_match.group(0)
+                    break
+            
+            # Extract benefits (look for common benefit keywords)
+            found_benefits = [hit.lower().title() for hit in _BENEFITS_RE.findall(desc_text)]
+            if found_benefits:
+                details['benefits'] = list(dict.fromkeys(found_benefits))  # Remove duplicates
+        
+        # Try to extract summary (often in a specific element)
+        summary_elem = tree.css_first('p.job-summary') or tree.css_first('div.summary')
+        if summary_elem:
+            details['summary'] = summary_elem.text(strip=True)
+        elif details['description']:
+            # Use first paragraph of description as summary
+            paragraphs = details['description'].split('\n')
+            for para in paragraphs:
+                if len(para) > 50:
+                    details['summary'] = para[:300] + '...' if len(para) > 300 else para
+                    break
+        
+        # Extract posted date from JSON-LD structured data, scanning the
+        # raw HTML first so the scripts only get decoded on a miss
+        date_match = _DATE_POSTED_RE.search(html)
+        if date_match:
+            details['posted_date'] = date_match.group(1)
+        else:
+            for script in tree.css('script[type="application/ld+json"]'):
+                try:
+                    data = json.loads(script.text())
+                except ValueError:
+                    continue
+                
+                # A block may hold one object, a list of them, or an @graph
+                if isinstance(data, dict):
+                    data = data.get('@graph', [data])
+                if not isinstance(data, list):
+                    continue
+                posted_date = next(
+                    (item['datePosted'] for item in data
+                     if isinstance(item, dict) and isinstance(item.get('datePosted'), str)),
+                    None
+                )
+                if posted_date:
+                    details['posted_date'] = posted_date
+                    break
+        
+    except Exception as e:
+        print(f"Error extracting job details from {job_url}: {e}")
+    
+    return details
+
+
+def _run_async(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+    
+    Uses a separate thread when the caller already has a running event loop
+    (e.g., Jupyter), where asyncio.run would refuse to start.
+    
+    Args:
+        coro: Coroutine to run
+    
+    Returns:
+        The coroutine's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
 
 
 class USNLXScraper:
@@ -41,29 +279,68 @@ class USNLXScraper:
         
         if self.browser_type.lower() == "chrome":
             options = ChromeOptions()
+            # Return from navigation at DOMContentLoaded; explicit waits cover the rest
+            options.page_load_strategy = 'eager'
             if self.headless:
                 options.add_argument('--headless')
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-dev-shm-usage')
             options.add_argument('--disable-gpu')
             
-            service = ChromeService(ChromeDriverManager().install())
+            # Skip resources that don't affect the scraped HTML
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_argument('--disable-extensions')
+            options.add_argument('--disable-background-networking')
+            options.add_argument('--disable-features=Translate,BackForwardCache')
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2
+            })
+            
+            service = ChromeService(_chrome_driver_path(), popen_kw=_DRIVER_POPEN_KW)
             self.driver = webdriver.Chrome(service=service, options=options)
+            
+            # Chrome has no content setting for fonts; block them by URL
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URL_PATTERNS})
         else:
             options = FirefoxOptions()
+            options.page_load_strategy = 'eager'
             if self.headless:
                 options.add_argument('--headless')
             
-            service = FirefoxService(GeckoDriverManager().install())
+            # Skip resources that don't affect the scraped HTML
+            options.set_preference('permissions.default.image', 2)
+            options.set_preference('browser.display.use_document_fonts', 0)
+            
+            service = FirefoxService(_gecko_driver_path(), popen_kw=_DRIVER_POPEN_KW)
             self.driver = webdriver.Firefox(service=service, options=options)
+    
+    def _kill_driver(self):
+        """
+        Kill the driver and browser processes outright, without a WebDriver call.
         
-        self.driver.implicitly_wait(config.IMPLICIT_WAIT)
+        Used when the browser may be hung and quit() could block.
+        """
+        service = getattr(self.driver, 'service', None)
+        process = getattr(service, 'process', None)
+        if process and os.name == 'posix':
+            try:
+                # The driver leads its own process group, which includes the browser
+                os.killpg(process.pid, signal.SIGKILL)
+            except OSError:
+                pass  # Already gone
+        self.driver = None
     
     def _close_driver(self):
         """Close the WebDriver."""
         if self.driver:
-            self.driver.quit()
-            self.driver = None
+            try:
+                self.driver.quit()
+            except Exception:
+                pass  # Browser or driver process already gone
+            finally:
+                self.driver = None
     
     def _build_search_url(self, role: str, city: str, radius_miles: int = None) -> str:
         """
@@ -87,34 +364,94 @@ class USNLXScraper:
             params['r'] = radius_miles
         return f"{config.USNLX_BASE_URL}?{urlencode(params)}"
     
-    def _click_more_button(self) -> bool:
+    def _count_job_links(self) -> int:
+        """Return the number of job listings currently in the page."""
+        return self.driver.execute_script(
+            "return document.querySelectorAll(arguments[0]).length;", _JOB_LINK_SELECTOR
+        )
+    
+    def _click_more_button(self, timeout: float = 1) -> bool:
         """
         Click the "More" button to load additional job listings.
         
+        Args:
+            timeout: Seconds to wait for the button to become clickable
+        
         Returns:
             True if button was clicked, False if not found or not clickable
         """
         try:
             # Wait for the "More" button to be present and clickable
             # Using aria-label as the most reliable selector
-            more_button = WebDriverWait(self.driver, config.USNLX_TIMEOUT).until(
+            more_button = WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[aria-label="Load more jobs"]'))
             )
             
             # Scroll to button
             self.driver.execute_script("arguments[0].scrollIntoView(true);", more_button)
-            time.sleep(0.5)
             
             # Click the button
+            prev_count = self._count_job_links()
             more_button.click()
             
-            # Wait a moment for new jobs to load
-            time.sleep(1.5)
+            # Wait for new jobs to be appended to the list
+            try:
+                WebDriverWait(self.driver, 5, poll_frequency=0.1).until(
+                    lambda d: self._count_job_links() > prev_count
+                )
+            except TimeoutException:
+                pass  # Button was clicked but nothing new loaded yet
             
             return True
         except (TimeoutException, NoSuchElementException):
             return False
     
+    def _get_new_listings_html(self, start: int) -> Tuple[int, str]:
+        """
+        Get the HTML of job listings appended since the last call.
+        
+        Args:
+            start: Number of listings already collected
+        
+        Returns:
+            Tuple of (total listings in the page, outer HTML of the new ones)
+        """
+        count, html = self.driver.execute_script(
+            "const links = document.querySelectorAll(arguments[0]);"
+            "return [links.length,"
+            " Array.from(links).slice(arguments[1]).map(a => a.outerHTML).join('')];",
+            _JOB_LINK_SELECTOR,
+            start
+        )
+        return count, html
+    
+    def _collect_new_jobs(
+        self,
+        start: int,
+        include_keywords: Optional[List[str]],
+        include_automaton: Optional[ahocorasick.Automaton],
+        exclude_automaton: Optional[ahocorasick.Automaton]
+    ) -> Tuple[int, List[Dict]]:
+        """
+        Parse and keyword-filter the job listings appended since the last call.
+        
+        Args:
+            start: Number of listings already collected
+            include_keywords: Keywords the include automaton was built from
+            include_automaton: Automaton from _build_keyword_automaton(include_keywords)
+            exclude_automaton: Automaton from _build_keyword_automaton(exclude_keywords)
+        
+        Returns:
+            Tuple of (total listings in the page, new matching jobs)
+        """
+        loaded, html = self._get_new_listings_html(start)
+        new_jobs = self._parse_job_listings(html)
+        if include_automaton or exclude_automaton:
+            new_jobs = self._filter_with_automata(
+                new_jobs, include_keywords, include_automaton, exclude_automaton
+            )
+        return loaded, new_jobs
+    
     def _parse_job_listings(self, html: str) -> List[Dict]:
         """
         Parse job listings from HTML.
@@ -125,36 +462,35 @@ class USNLXScraper:
         Returns:
             List of job dictionaries
         """
-        soup = BeautifulSoup(html, 'lxml')
+        tree = LexborHTMLParser(html)
         jobs = []
         
         # Find all job listing links
-        job_links = soup.find_all('a', class_='flex px-2 py-4')
+        job_links = tree.css(_JOB_LINK_SELECTOR)
         
         for link in job_links:
             try:
                 # Extract job title
-                title_elem = link.find('h2')
-                title = title_elem.get_text(strip=True) if title_elem else ''
+                title_elem = link.css_first('h2')
+                title = title_elem.text(strip=True) if title_elem else ''
                 
                 # Extract company and location from the paragraph
-                info_elem = link.find('p')
+                info_elem = link.css_first('p')
                 company = ''
                 location = ''
                 
                 if info_elem:
                     # Company is in a span
-                    company_elem = info_elem.find('span')
+                    company_elem = info_elem.css_first('span')
                     if company_elem:
-                        company = company_elem.get_text(strip=True)
-                    
-                    # Location is the text after the company span
-                    full_text = info_elem.get_text(strip=True)
-                    if company:
-                        location = full_text.replace(company, '').strip()
+                        company = company_elem.text(strip=True)
+                        
+                        # Location is the text left once the company span is removed
+                        company_elem.decompose()
+                        location = info_elem.text(strip=True)
                 
                 # Extract job URL
-                job_url = link.get('href', '')
+                job_url = link.attributes.get('href') or ''
                 if job_url and not job_url.startswith('http'):
                     job_url = f"https://usnlx.com{job_url}"
                 
@@ -182,145 +518,81 @@ class USNLXScraper:
         
         return jobs
     
-    def _extract_job_details(self, job_url: str) -> Dict:
+    async def _fetch_job_details(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        executor: Optional[Executor],
+        index: int,
+        job: Dict,
+        total: int
+    ) -> Dict:
         """
-        Extract detailed information from a job detail page.
+        Fetch a job detail page and extract its details.
         
         Args:
-            job_url: URL of the job detail page
+            client: Shared HTTP client
+            semaphore: Semaphore limiting concurrent requests
+            executor: Executor that parses the page (None for the loop's default)
+            index: Job index (1-based)
+            job: Job dictionary containing URL
+            total: Total number of jobs
         
         Returns:
             Dictionary with detailed job information
         """
-        details = {
-            'summary': None,
-            'pay_range': None,
-            'employment_type': None,
-            'remote_status': None,
-            'benefits': None,
-            'description': None,
-            'posted_date': None
-        }
-        
-        try:
-            # Navigate to job detail page
-            self.driver.get(job_url)
-            
-            # Wait for page to load
-            time.sleep(2)
-            
-            # Get page HTML
-            soup = BeautifulSoup(self.driver.page_source, 'lxml')
-            
-            # Extract job description (usually in a div with class 'job-description' or similar)
-            desc_elem = soup.find('div', class_='job-description')
-            if not desc_elem:
-                # Try alternative selectors
-                desc_elem = soup.find('div', {'id': 'job-description'})
-            if not desc_elem:
-                # Try to find any div containing substantial text
-                all_divs = soup.find_all('div')
-                for div in all_divs:
-                    text = div.get_text(strip=True)
-                    if len(text) > 200:  # Likely the description
-                        desc_elem = div
-                        break
-            
-            if desc_elem:
-                details['description'] = desc_elem.get_text(separator='\n', strip=True)
-                
-                # Try to extract specific fields from description
-                desc_text = details['description'].lower()
-                
-                # Extract employment type
-                if 'full-time' in desc_text or 'full time' in desc_text:
-                    details['employment_type'] = 'Full-time'
-                elif 'part-time' in desc_text or 'part time' in desc_text:
-                    details['employment_type'] = 'Part-time'
-                elif 'contract' in desc_text:
-                    details['employment_type'] = 'Contract'
-                
-                # Extract remote status
-                if 'remote' in desc_text and 'not remote' not in desc_text:
-                    if 'hybrid' in desc_text:
-                        details['remote_status'] = 'Hybrid'
-                    else:
-                        details['remote_status'] = 'Remote'
-                elif 'on-site' in desc_text or 'onsite' in desc_text or 'in-office' in desc_text:
-                    details['remote_status'] = 'On-site'
-                
-                # Try to extract pay range (common patterns)
-                import re
-                pay_patterns = [
-                    r'\$[\d,]+\s*-\s*\$[\d,]+\s*(?:per|/)\s*(?:year|hour|yr|hr)',
-                    r'\$[\d,]+k?\s*-\s*\$[\d,]+k?',
-                    r'salary:?\s*\$[\d,]+\s*-\s*\$[\d,]+',
-                ]
-                for pattern in pay_patterns:
-                    match = re.search(pattern, desc_text, re.IGNORECASE)
-                    if match:
-                        details['pay_range'] = match.group(0)
-                        break
-                
-                # Extract benefits (look for common benefit keywords)
-                benefit_keywords = ['health insurance', '401k', 'pto', 'paid time off', 
-                                   'dental', 'vision', 'retirement', 'bonus']
-                found_benefits = []
-                for keyword in benefit_keywords:
-                    if keyword in desc_text:
-                        found_benefits.append(keyword.title())
-                if found_benefits:
-                    details['benefits'] = list(set(found_benefits))  # Remove duplicates
-            
-            # Try to extract summary (often in a specific element)
-            summary_elem = soup.find('p', class_='job-summary')
-            if not summary_elem:
-                summary_elem = soup.find('div', class_='summary')
-            if summary_elem:
-                details['summary'] = summary_elem.get_text(strip=True)
-            elif details['description']:
-                # Use first paragraph of description as summary
-                paragraphs = details['description'].split('\n')
-                for para in paragraphs:
-                    if len(para) > 50:
-                        details['summary'] = para[:300] + '...' if len(para) > 300 else para
-                        break
-            
-            # Extract posted date from JSON-LD structured data
+        async with semaphore:
+            print(f"  [{index}/{total}] {job['title'][:50]}...")
             try:
-                import json as json_module
-                import re
-                json_ld_scripts = soup.find_all('script', type='application/ld+json')
-                for script in json_ld_scripts:
-                    try:
-                        data = json_module.loads(script.string)
-                        if isinstance(data, dict) and 'datePosted' in data:
-                            details['posted_date'] = data['datePosted']
-                            break
-                    except:
-                        continue
+                response = await client.get(job['url'])
+                response.raise_for_status()
             except Exception as e:
-                pass  # posted_date will remain None
-            
-        except Exception as e:
-            print(f"Error extracting job details from {job_url}: {e}")
+                print(f"Error fetching job details from {job['url']}: {e}")
+                return dict.fromkeys(_DETAIL_FIELDS)
         
-        return details
+        # Parse off the event loop so other fetches keep progressing
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, _parse_detail_html, response.text, job['url'])
+        except Exception as e:
+            print(f"Error extracting job details from {job['url']}: {e}")
+            return dict.fromkeys(_DETAIL_FIELDS)
     
-    def _extract_job_details_with_index(self, index: int, job: Dict, total: int) -> Dict:
+    async def _fetch_all_job_details(self, jobs: List[Dict]) -> List[Dict]:
         """
-        Extract job details with progress reporting (for parallel execution).
+        Fetch details for all jobs concurrently over a pooled HTTP/2 client.
         
         Args:
-            index: Job index (1-based)
-            job: Job dictionary containing URL
-            total: Total number of jobs
+            jobs: List of job dictionaries containing URLs
         
         Returns:
-            Dictionary with detailed job information
+            List of detail dictionaries, in the same order as jobs
         """
-        print(f"  [{index}/{total}] {job['title'][:50]}...")
-        return self._extract_job_details(job['url'])
+        semaphore = asyncio.Semaphore(_DETAIL_CONCURRENCY)
+        limits = httpx.Limits(max_connections=_DETAIL_CONCURRENCY)
+        
+        # Parse pages across CPU cores while fetches continue. Pool workers
+        # (search_jobs_parallel) are daemonic and can't start child
+        # processes, so they parse on the loop's default thread pool instead.
+        executor = None
+        if not multiprocessing.current_process().daemon:
+            executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        
+        try:
+            async with httpx.AsyncClient(
+                http2=True,
+                limits=limits,
+                headers=_HTTP_HEADERS,
+                timeout=config.USNLX_TIMEOUT,
+                follow_redirects=True
+            ) as client:
+                return await asyncio.gather(*(
+                    self._fetch_job_details(client, semaphore, executor, i, job, len(jobs))
+                    for i, job in enumerate(jobs, 1)
+                ))
+        finally:
+            if executor:
+                executor.shutdown()
     
     def _set_distance_filter(self, radius_miles: int) -> bool:
         """
@@ -333,30 +605,17 @@ class USNLXScraper:
             True if filter was set successfully, False otherwise
         """
         try:
-            # Wait for page to load
-            time.sleep(2)
-            
-            # Look for distance/radius dropdown or filter
-            # Common selectors for distance filters
-            selectors = [
-                "//select[contains(@name, 'radius')]",
-                "//select[contains(@name, 'distance')]",
-                "//select[contains(@id, 'radius')]",
-                "//select[contains(@id, 'distance')]",
-                "//select[contains(@class, 'radius')]",
-                "//select[contains(@class, 'distance')]"
-            ]
-            
-            distance_select = None
-            for selector in selectors:
-                try:
-                    distance_select = self.driver.find_element(By.XPATH, selector)
-                    if distance_select:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            if not distance_select:
+            # Look for distance/radius dropdown or filter in a single DOM query
+            selector = (
+                "//select[contains(@name, 'radius') or contains(@name, 'distance')"
+                " or contains(@id, 'radius') or contains(@id, 'distance')"
+                " or contains(@class, 'radius') or contains(@class, 'distance')]"
+            )
+            try:
+                distance_select = WebDriverWait(
+                    self.driver, config.USNLX_TIMEOUT, poll_frequency=0.1
+                ).until(EC.presence_of_element_located((By.XPATH, selector)))
+            except TimeoutException:
                 print(f"Warning: Could not find distance filter dropdown")
                 return False
             
@@ -372,9 +631,22 @@ class USNLXScraper:
                 
                 # Check if this option matches our radius
                 if radius_str in option_text or radius_str in str(option_value):
+                    try:
+                        first_link = self.driver.find_element(By.CSS_SELECTOR, _JOB_LINK_SELECTOR)
+                    except NoSuchElementException:
+                        first_link = None
+                    
                     select.select_by_visible_text(option.text)
                     print(f"✓ Set distance filter to: {option.text}")
-                    time.sleep(1)  # Wait for filter to apply
+                    
+                    # Wait for filter to apply: the old listings are replaced
+                    if first_link:
+                        try:
+                            WebDriverWait(self.driver, config.USNLX_TIMEOUT, poll_frequency=0.1).until(
+                                EC.staleness_of(first_link)
+                            )
+                        except TimeoutException:
+                            print("Warning: Listings did not refresh after setting distance filter")
                     return True
             
             # If exact match not found, try to find closest match
@@ -392,7 +664,8 @@ class USNLXScraper:
         radius_miles: int = None,
         extract_details: bool = False,
         include_keywords: List[str] = None,
-        exclude_keywords: List[str] = None
+        exclude_keywords: List[str] = None,
+        max_results: int = None
     ) -> List[Dict]:
         """
         Search for jobs on USNLX.
@@ -404,10 +677,13 @@ class USNLXScraper:
             extract_details: If True, click into each job to extract detailed info
             include_keywords: Only include jobs with titles containing these keywords
             exclude_keywords: Exclude jobs with titles containing these keywords
+            max_results: Stop loading listings once this many matching jobs are found
         
         Returns:
             List of job dictionaries with standardized fields
         """
+        # Leave an already-open driver (context manager, pool worker) running
+        owns_driver = self.driver is None
         try:
             # Initialize driver
             self._init_driver()
@@ -418,74 +694,93 @@ class USNLXScraper:
             
             # Wait for initial job listings to load
             try:
-                WebDriverWait(self.driver, config.USNLX_TIMEOUT).until(
-                    EC.presence_of_element_located((By.TAG_NAME, 'li'))
+                WebDriverWait(self.driver, config.USNLX_TIMEOUT, poll_frequency=0.1).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _JOB_LINK_SELECTOR))
                 )
             except TimeoutException:
                 print("Timeout waiting for job listings to load")
                 return []
             
-            # Click "More" button repeatedly to load ALL jobs
+            # Click "More" button repeatedly to load ALL jobs, parsing each
+            # newly appended batch so loading can stop once enough match
+            jobs = []
+            loaded = 0
             clicks = 0
+            no_progress = 0
+            filter_jobs = include_keywords or exclude_keywords
+            include_automaton = _build_keyword_automaton(include_keywords)
+            exclude_automaton = _build_keyword_automaton(exclude_keywords)
             print("Loading all job listings...")
-            while clicks < config.USNLX_MAX_MORE_CLICKS:
-                if not self._click_more_button():
-                    # No more button found or not clickable - we've loaded all jobs
+            while True:
+                prev_loaded = loaded
+                loaded, new_jobs = self._collect_new_jobs(
+                    loaded, include_keywords, include_automaton, exclude_automaton
+                )
+                jobs.extend(new_jobs)
+                
+                if max_results and len(jobs) >= max_results:
+                    break
+                
+                # Stop once clicking has twice in a row loaded nothing new
+                if clicks and loaded == prev_loaded:
+                    no_progress += 1
+                    if no_progress >= 2:
+                        break
+                else:
+                    no_progress = 0
+                
+                # Give the first page the full timeout to render the button; after
+                # that it is already in place once the previous click's jobs load
+                timeout = config.USNLX_TIMEOUT if clicks == 0 else 1
+                if clicks >= config.USNLX_MAX_MORE_CLICKS or not self._click_more_button(timeout):
+                    # No more button found or not clickable - we've loaded all jobs.
+                    # Collect anything the last click appended after it was checked.
+                    loaded, new_jobs = self._collect_new_jobs(
+                        loaded, include_keywords, include_automaton, exclude_automaton
+                    )
+                    jobs.extend(new_jobs)
                     break
                 clicks += 1
                 if clicks % 5 == 0:
                     print(f"  Loaded {clicks * 15}+ jobs...")
             
-            # Get the final page HTML
-            html = self.driver.page_source
-            
-            # Parse job listings
-            jobs = self._parse_job_listings(html)
+            if max_results:
+                jobs = jobs[:max_results]
             
-            print(f"Retrieved {len(jobs)} total jobs from USNLX")
-            
-            # Filter by keywords if specified
-            if include_keywords or exclude_keywords:
-                jobs = self._filter_by_keywords(jobs, include_keywords, exclude_keywords)
+            print(f"Retrieved {loaded} total jobs from USNLX")
+            if filter_jobs:
                 print(f"Filtered to {len(jobs)} matching jobs")
             
             # Extract details if requested
             if extract_details:
-                print(f"Extracting details for {len(jobs)} jobs in parallel (10 at a time)...")
-                detailed_jobs = []
+                print(f"Extracting details for {len(jobs)} jobs "
+                      f"({_DETAIL_CONCURRENCY} at a time)...")
                 
-                # Use ThreadPoolExecutor for parallel scraping
-                with ThreadPoolExecutor(max_workers=10) as executor:
-                    # Submit all jobs for detail extraction
-                    future_to_job = {
-                        executor.submit(self._extract_job_details_with_index, i, job, len(jobs)): job 
-                        for i, job in enumerate(jobs, 1)
-                    }
-                    
-                    # Collect results as they complete
-                    for future in as_completed(future_to_job):
-                        job = future_to_job[future]
-                        try:
-                            details = future.result()
-                            # Merge details into job
-                            job.update(details)
-                            detailed_jobs.append(job)
-                        except Exception as e:
-                            print(f"  Error extracting details for {job['title']}: {e}")
-                            detailed_jobs.append(job)  # Add job without details
+                # Detail pages are server-rendered, so fetch them over HTTP
+                # instead of navigating the browser to each one
+                try:
+                    all_details = _run_async(self._fetch_all_job_details(jobs))
+                except Exception as e:
+                    # Keep the listings even if detail extraction fails outright
+                    print(f"Error extracting job details: {e}")
+                    all_details = [dict.fromkeys(_DETAIL_FIELDS) for _ in jobs]
+                for job, details in zip(jobs, all_details):
+                    job.update(details)
                 
-                jobs = detailed_jobs
                 print(f"✓ Completed detail extraction for {len(jobs)} jobs")
             
             return jobs
             
         except Exception as e:
             print(f"Error scraping USNLX: {e}")
+            # The browser may have crashed; make the next search start a fresh one
+            self._close_driver()
             return []
         
         finally:
             # Clean up
-            self._close_driver()
+            if owns_driver:
+                self._close_driver()
     
     def _filter_by_keywords(
         self, 
@@ -501,6 +796,33 @@ class USNLXScraper:
             include_keywords: Only include jobs with titles containing these keywords
             exclude_keywords: Exclude jobs with titles containing these keywords
         
+        Returns:
+            Filtered list of jobs
+        """
+        # Match all keywords against each title in a single pass
+        return self._filter_with_automata(
+            jobs,
+            include_keywords,
+            _build_keyword_automaton(include_keywords),
+            _build_keyword_automaton(exclude_keywords)
+        )
+    
+    def _filter_with_automata(
+        self,
+        jobs: List[Dict],
+        include_keywords: Optional[List[str]],
+        include_automaton: Optional[ahocorasick.Automaton],
+        exclude_automaton: Optional[ahocorasick.Automaton]
+    ) -> List[Dict]:
+        """
+        Filter jobs by title keywords using prebuilt automata.
+        
+        Args:
+            jobs: List of job dictionaries
+            include_keywords: Keywords the include automaton was built from
+            include_automaton: Automaton from _build_keyword_automaton(include_keywords)
+            exclude_automaton: Automaton from _build_keyword_automaton(exclude_keywords)
+        
         Returns:
             Filtered list of jobs
         """
@@ -510,17 +832,18 @@ class USNLXScraper:
             title_lower = job['title'].lower()
             
             # Check exclude keywords first
-            if exclude_keywords:
-                if any(keyword.lower() in title_lower for keyword in exclude_keywords):
+            if exclude_automaton:
+                if next(exclude_automaton.iter(title_lower), None):
                     continue
             
             # Check include keywords
-            if include_keywords:
-                if any(keyword.lower() in title_lower for keyword in include_keywords):
-                    job['matched_keywords'] = [
-                        kw for kw in include_keywords 
-                        if kw.lower() in title_lower
-                    ]
+            if include_automaton:
+                hits = {keyword for _, keyword in include_automaton.iter(title_lower)}
+                if hits:
+                    job['matched_keywords'] = list(dict.fromkeys(
+                        kw for kw in include_keywords
+                        if kw.lower() in hits
+                    ))
                     filtered_jobs.append(job)
             else:
                 filtered_jobs.append(job)
@@ -535,3 +858,91 @@ class USNLXScraper:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self._close_driver()
+
+
+# Scraper owned by the current pool worker, kept warm across searches
+_worker_scraper = None
+
+
+def _on_worker_terminate(signum, frame):
+    """Kill this worker's browser before exiting on SIGTERM (pool.terminate)."""
+    if _worker_scraper is not None:
+        _worker_scraper._kill_driver()
+    os._exit(1)
+
+
+def _scrape_one(search: Dict) -> List[Dict]:
+    """
+    Run a single search with this worker's browser (process pool worker).
+    
+    The browser is started on the worker's first search and reused for
+    every later search it runs; it is closed when the worker exits.
+    
+    Args:
+        search: Keyword arguments for USNLXScraper.search_jobs
+    
+    Returns:
+        List of job dictionaries
+    """
+    global _worker_scraper
+    if _worker_scraper is None:
+        _worker_scraper = USNLXScraper()
+        multiprocessing.util.Finalize(
+            _worker_scraper, _worker_scraper._close_driver, exitpriority=0
+        )
+        # Pool.terminate() sends SIGTERM, which skips the finalizer above
+        signal.signal(signal.SIGTERM, _on_worker_terminate)
+    
+    try:
+        _worker_scraper._init_driver()
+    except Exception as e:
+        print(f"Error starting browser: {e}")
+        return []
+    
+    return _worker_scraper.search_jobs(**search)
+
+
+def search_jobs_parallel(searches: List[Dict], processes: int = None) -> List[Dict]:
+    """
+    Run several USNLX searches in parallel, one browser per process.
+    
+    Selenium drivers are not thread-safe, so each worker process owns its
+    own driver.
+    
+    Args:
+        searches: List of keyword argument dicts for USNLXScraper.search_jobs
+                  (e.g., {'role': 'Nurse', 'city': 'Chicago'})
+        processes: Number of worker processes (default: one per search, capped at CPU count)
+    
+    Returns:
+        Combined list of job dictionaries, in search order
+    """
+    if not searches:
+        return []
+    
+    processes = processes or min(len(searches), multiprocessing.cpu_count())
+    rounds = -(-len(searches) // processes)
+    deadline = time.monotonic() + _SEARCH_TIMEOUT * rounds
+    
+    pool = multiprocessing.Pool(processes=processes)
+    results = []
+    clean_exit = False
+    try:
+        pending = [pool.apply_async(_scrape_one, (search,)) for search in searches]
+        for search, result in zip(searches, pending):
+            try:
+                results.append(result.get(max(0, deadline - time.monotonic())))
+            except multiprocessing.TimeoutError:
+                print(f"Timed out searching for {search.get('role')} in {search.get('city')}")
+                results.append([])
+        clean_exit = all(result.ready() for result in pending)
+    finally:
+        if clean_exit:
+            # Let workers exit normally so their browsers get closed
+            pool.close()
+        else:
+            # A worker is stuck (e.g., a hung browser); don't wait on it
+            pool.terminate()
+        pool.join()
+    
+    return [job for jobs in results for job in jobs]
@@ -3,6 +3,10 @@ Utility functions for job scraper.
 """
 from typing import List, Dict
 import re
+import sys
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
 
 
 def normalize_location(location: str) -> str:
@@ -16,7 +20,7 @@ def normalize_location(location: str) -> str:
         Normalized location string in lowercase
     """
     # Remove extra whitespace
-    location = re.sub(r'\s+', ' ', location.strip())
+    location = _WHITESPACE_RE.sub(' ', location.strip())
     # Convert to lowercase for comparison
     return location.lower()
 
@@ -31,17 +35,22 @@ def deduplicate_jobs(jobs: List[Dict]) -> List[Dict]:
     Returns:
         Deduplicated list of jobs
     """
+    # Build all normalized (title, company, location) keys in one pass.
+    # Interning lets repeated companies/locations compare by identity.
+    intern = sys.intern
+    keys = [
+        (
+            intern(job.get('title', '').lower().strip()),
+            intern(job.get('company', '').lower().strip()),
+            intern(_WHITESPACE_RE.sub(' ', job.get('location', '').strip()).lower())
+        )
+        for job in jobs
+    ]
+    
     seen = set()
     unique_jobs = []
     
-    for job in jobs:
-        # Create a unique key from title, company, and location
-        key = (
-            job.get('title', '').lower().strip(),
-            job.get('company', '').lower().strip(),
-            normalize_location(job.get('location', ''))
-        )
-        
+    for key, job in zip(keys, jobs):
         if key not in seen and all(key):  # Ensure all parts exist
             seen.add(key)
             unique_jobs.append(job)